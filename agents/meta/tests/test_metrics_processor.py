@@ -0,0 +1,21 @@
+import pandas as pd
+from src.agents.metrics.metrics_processor import MetricsProcessor
+
+class TestProcessMetrics:
+    def test_timestamps_normalize_to_naive_datetimes(self):
+        """Aware, naive and mixed-precision ISO strings share one datetime column"""
+        raw_data = [
+            {'name': 'cpu_usage', 'value': 1.0, 'timestamp': '2024-01-01T10:00:00Z'},
+            {'name': 'cpu_usage', 'value': 2.0, 'timestamp': '2024-01-01T10:00:00.250000'},
+            {'name': 'cpu_usage', 'value': 3.0, 'timestamp': '2024-01-01T10:00:01'},
+            {'name': 'cpu_usage', 'value': 4.0, 'timestamp': 1704103200}
+        ]
+
+        df = MetricsProcessor().process_metrics(raw_data)
+
+        assert pd.api.types.is_datetime64_dtype(df['timestamp'])
+        assert df['timestamp'].notna().all()
+        assert df['timestamp'][1] == pd.Timestamp('2024-01-01T10:00:00.250000')
+        assert df['timestamp'][2] == pd.Timestamp('2024-01-01T10:00:01')
+        # Both absolute instants land on the same local wall-clock time
+        assert df['timestamp'][0] == df['timestamp'][3]
@@ -0,0 +1,27 @@
+import math
+import pytest
+from src.agents.metrics.training import model_registry
+from src.agents.metrics.training.model_registry import MetricModelRegistry
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    monkeypatch.setitem(model_registry.settings.METRIC_CONFIG, 'model_dir', str(tmp_path))
+    return MetricModelRegistry()
+
+class TestModelRegistryMetadata:
+    @pytest.mark.asyncio
+    async def test_nan_metrics_round_trip(self, registry):
+        """A flat validation series yields NaN scores, the metadata must stay readable"""
+        registry._write_metadata(
+            registry._get_metadata_path('cpu'),
+            {'metrics': {'r2': float('nan'), 'mape': float('inf')}, 'training_samples': 48}
+        )
+
+        info = await registry.get_model_info('cpu')
+        batch = await registry.get_model_info_batch(['cpu'])
+        listed = await registry.list_models()
+
+        assert math.isnan(info['metrics']['r2'])
+        assert info['metrics']['mape'] == float('inf')
+        assert batch['cpu']['training_samples'] == 48
+        assert 'cpu' in listed
@@ -0,0 +1,23 @@
+from collections import Counter
+from src.agents.security.pattern_detector import SecurityPatternDetector
+
+class TestDetectPatternsCountsOnly:
+    def test_counts_match_detect_patterns(self):
+        """The counts-only path tallies exactly the issues detect_patterns builds"""
+        context = [
+            "2024-03-10 10:15:23 Failed login attempt for user admin: invalid password",
+            {'content': "Repeated login attempts from 192.168.1.100, IP blocked", 'timestamp': '2024-03-10T10:15:25'},
+            {'message': "SQL injection detected in /search?q=' OR 1=1 --", 'metadata': {'timestamp': '2024-03-10T10:16:00'}},
+            {'message': "sudo privilege escalation attempt by www-data"},
+            "Quarantined trojan and ransomware payload; access denied",
+            "GET /health 200",
+            42
+        ]
+        detector = SecurityPatternDetector()
+
+        issues = detector.detect_patterns(context)
+        counts = detector.detect_patterns_counts_only(context)
+
+        assert issues
+        assert counts['by_type'] == Counter(issue['type'] for issue in issues)
+        assert counts['by_severity'] == Counter(issue['severity'] for issue in issues)
@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+from src.agents.metrics.predictor import MetricPredictor
+
+def _metric_frame(values):
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=len(values), freq='min'),
+        'metric': 'cpu_usage',
+        'value': values
+    })
+
+class TestChangePoints:
+    def test_rise_from_zero_is_an_increase(self):
+        """A rise after a run of zeros is +inf, whatever the rolling residue sign"""
+        values = [51.2, 95.0, 14.4, 94.9, 31.2] + [0.0] * 10 + [8.0] * 5
+
+        change_points = MetricPredictor()._calculate_change_points(_metric_frame(values))
+
+        rise = [point for point in change_points if point['value'] == 8.0]
+        assert rise[0]['change_percentage'] == np.inf
+        assert all(point['value'] != 0.0 or point['change_percentage'] < 0 for point in change_points)
+
+class TestDetectAnomalies:
+    def test_flat_run_is_not_anomalous(self):
+        """A metric going idle must not be reported through a zero rolling std"""
+        values = [12.3, 40.1, 7.7, 0.1] + [0.0] * 20
+
+        anomalies = MetricPredictor().detect_anomalies(_metric_frame(values), {})
+
+        assert anomalies == []
@@ -0,0 +1,35 @@
+from src.agents.security.prompt_generator import SecurityPromptGenerator
+
+class TestExtractRecommendations:
+    def test_markdown_analysis(self):
+        """Bullets are extracted, bold sub-headings are not mistaken for them"""
+        analysis = (
+            "## Summary\n"
+            "**Severity:** high\n"
+            "\n"
+            "## Recommendations\n"
+            "**Immediate actions**\n"
+            "- Block 192.168.1.100 at the firewall\n"
+            "* Rotate the **admin** credentials\n"
+            "1. Enable MFA on SSH access\n"
+            "\n"
+            "**Long-term**\n"
+            "• Centralize authentication logs\n"
+        )
+
+        recommendations = SecurityPromptGenerator().extract_recommendations(analysis)
+
+        assert recommendations == [
+            "Block 192.168.1.100 at the firewall",
+            "Rotate the **admin** credentials",
+            "Enable MFA on SSH access",
+            "Centralize authentication logs"
+        ]
+
+    def test_crlf_line_endings(self):
+        """Carriage returns from CRLF output are not kept in the recommendations"""
+        analysis = "Recommendations:\r\n- Block IP\r\n- Rotate keys\r\n"
+
+        recommendations = SecurityPromptGenerator().extract_recommendations(analysis)
+
+        assert recommendations == ["Block IP", "Rotate keys"]
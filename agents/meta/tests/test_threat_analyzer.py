@@ -0,0 +1,48 @@
+from src.agents.security.threat_analyzer import ThreatAnalyzer, ThreatStats
+
+def _issue(issue_type, severity, context, timestamp=None):
+    issue = {'type': issue_type, 'severity': severity, 'context': context}
+    if timestamp:
+        issue['timestamp'] = timestamp
+    return issue
+
+class TestComputeStats:
+    def test_generator_input(self):
+        """Stats are tallied from a streamed feed, not only from a list"""
+        issues = [
+            _issue('auth_failure', 'high', 'Failed login from 192.168.1.100', '2024-03-10T10:15:23'),
+            _issue('brute_force', 'critical', 'Failed login from 192.168.1.100', '2024-03-10T10:15:25'),
+            _issue('injection', 'critical', "GET /?q=' OR 1=1 from 10.0.0.7", '2024-03-10T11:02:00'),
+            _issue('malware', 'medium', 'checksum mismatch on 999.1.1.1')
+        ]
+
+        stats = ThreatAnalyzer().compute_stats(issue for issue in issues)
+
+        assert isinstance(stats, ThreatStats)
+        assert stats.total_issues == 4
+        assert stats.by_type == {'auth_failure': 1, 'brute_force': 1, 'injection': 1, 'malware': 1}
+        assert stats.by_severity == {'critical': 2, 'high': 1, 'medium': 1, 'low': 0}
+        assert stats.unique_ips == ['10.0.0.7', '192.168.1.100']
+        assert stats.temporal_distribution == {'10': 2, '11': 1}
+        assert stats.max_hour_count == 2
+
+    def test_asdict_keeps_stats_mapping(self):
+        """asdict() exposes the mapping the LLM payload and agent response use"""
+        stats = ThreatAnalyzer().compute_stats([
+            _issue('auth_failure', 'low', 'Failed login from 192.168.1.100', '2024-03-10T10:15:23')
+        ])
+
+        assert stats.asdict() == {
+            'total_issues': 1,
+            'by_type': {'auth_failure': 1},
+            'by_severity': {'critical': 0, 'high': 0, 'medium': 0, 'low': 1},
+            'unique_ips': ['192.168.1.100'],
+            'temporal_distribution': {'10': 1}
+        }
+
+    def test_empty_feed(self):
+        stats = ThreatAnalyzer().compute_stats(iter([]))
+
+        assert stats.total_issues == 0
+        assert stats.by_severity == {'critical': 0, 'high': 0, 'medium': 0, 'low': 0}
+        assert ThreatAnalyzer().calculate_risk_level([], stats) == 'low'
@@ -0,0 +1,18 @@
+import pytest
+import numpy as np
+import pandas as pd
+from src.agents.metrics.trend_analyzer import TrendAnalyzer
+
+class TestTrendAnalyzer:
+    @pytest.mark.asyncio
+    async def test_daily_forecast_stays_at_series_level(self):
+        """The seasonal term is a deviation added on top of the trend line"""
+        index = pd.date_range('2024-01-01', periods=24 * 7, freq='h')
+        values = 50 + 5 * np.sin(2 * np.pi * index.hour / 24)
+        data = pd.DataFrame({'value': values}, index=index)
+
+        result = await TrendAnalyzer().analyze_trends(data, 'cpu_usage')
+
+        assert result.seasonality == 'daily'
+        expected = 50 + 5 * np.sin(2 * np.pi * np.arange(5) / 24)
+        np.testing.assert_allclose(result.forecast, expected, atol=1.0)
@@ -8,6 +8,8 @@ setup(
        "athena-core",
        "prophet>=1.1.4",
        "pandas>=2.0.0",
-       "numpy>=1.24.0"
+       "numpy>=1.24.0",
+       "bottleneck>=1.3.0",
+       "orjson>=3.9.0"
    ],
 )
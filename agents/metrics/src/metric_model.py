@@ -1,18 +1,28 @@
 import pandas as pd
 import numpy as np
 from prophet import Prophet
+from collections import OrderedDict
 from typing import Dict, Tuple
 import logging
 from datetime import datetime, timedelta
 import joblib
 import os
+import threading
 
 logger = logging.getLogger(__name__)
 
 class MetricModel:
-    def __init__(self, model_dir: str = "models/metrics"):
+    def __init__(
+        self,
+        model_dir: str = "models/metrics",
+        max_cached_models: int = 32
+    ):
         self.model_dir = model_dir
-        self.models: Dict[str, Prophet] = {}
+        self.max_cached_models = max_cached_models
+        # LRU cache of deserialized models, most recently used last
+        self.models: OrderedDict[str, Prophet] = OrderedDict()
+        # train() runs on executor threads, so every cache mutation is guarded
+        self._models_lock = threading.Lock()
         self._ensure_model_dir()
         
     def _ensure_model_dir(self):
@@ -50,7 +60,7 @@ class MetricModel:
             joblib.dump(model, model_path)
             
             # Save model in memory
-            self.models[metric_name] = model
+            self._cache_model(metric_name, model)
             
             # Calculate model metrics
             metrics = self._calculate_model_metrics(model, df)
@@ -102,21 +112,31 @@ class MetricModel:
     def load_model(self, metric_name: str) -> Prophet:
         """Load trained model from disk"""
         try:
-            if metric_name in self.models:
-                return self.models[metric_name]
+            with self._models_lock:
+                if metric_name in self.models:
+                    self.models.move_to_end(metric_name)
+                    return self.models[metric_name]
                 
             model_path = os.path.join(self.model_dir, f"{metric_name}.joblib")
             if not os.path.exists(model_path):
                 raise FileNotFoundError(f"No trained model found for {metric_name}")
                 
             model = joblib.load(model_path)
-            self.models[metric_name] = model
+            self._cache_model(metric_name, model)
             return model
             
         except Exception as e:
             logger.error(f"Error loading model for {metric_name}: {e}")
             raise
             
+    def _cache_model(self, metric_name: str, model: Prophet):
+        """Store model in memory, evicting the least recently used one"""
+        with self._models_lock:
+            self.models[metric_name] = model
+            self.models.move_to_end(metric_name)
+            if len(self.models) > self.max_cached_models:
+                self.models.popitem(last=False)
+            
     def _calculate_model_metrics(self, model: Prophet, df: pd.DataFrame) -> Dict:
         """Calculate model performance metrics"""
         try:
@@ -151,8 +171,8 @@ class MetricModel:
             if os.path.exists(model_path):
                 os.remove(model_path)
                 
-            if metric_name in self.models:
-                del self.models[metric_name]
+            with self._models_lock:
+                self.models.pop(metric_name, None)
                 
             return True
             
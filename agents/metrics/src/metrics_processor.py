@@ -3,12 +3,16 @@ from typing import Dict, List, Any
 import pandas as pd
 import numpy as np
 from datetime import datetime
+from dateutil.tz import tzlocal
 import logging
 import json
 from src.monitoring.metrics_collector import MetricsCollector
 logger = logging.getLogger(__name__)
 
 class MetricsProcessor:
+    # Trailing UTC designator or numeric offset of an ISO-8601 timestamp
+    _TZ_SUFFIX = r'(?:Z|[+-]\d{2}:?\d{2})$'
+
     def __init__(self):
         self.required_columns = ['timestamp', 'metric', 'value', 'unit']
         self.metrics_collector = MetricsCollector()
@@ -42,6 +46,7 @@ class MetricsProcessor:
         """Process raw metrics data into a DataFrame"""
         try:
             metrics = []
+            now = datetime.now().isoformat()
             
             for item in raw_data:
                 if isinstance(item, str):
@@ -54,28 +59,36 @@ class MetricsProcessor:
                     continue
 
                 # Extract basic metric information
-                metric = {
-                    'timestamp': item.get('timestamp', datetime.now().isoformat()),
+                metrics.append({
+                    'timestamp': item.get('timestamp', now),
                     'metric': item.get('name', 'unknown'),
                     'value': item.get('value', 0.0),
                     'unit': item.get('unit', ''),
                     'metadata': item.get('metadata', {})
-                }
-
-                # Convert timestamp if it's a Unix timestamp
-                if isinstance(metric['timestamp'], (int, float)):
-                    metric['timestamp'] = datetime.fromtimestamp(
-                        metric['timestamp']
-                    ).isoformat()
-
-                metrics.append(metric)
+                })
 
             # Convert to DataFrame
             if not metrics:
                 return pd.DataFrame(columns=self.required_columns)
 
             df = pd.DataFrame(metrics)
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+
+            # Normalize timestamps column-wise to naive local time: Unix seconds
+            # (matching datetime.fromtimestamp), offset-aware ISO strings
+            # converted from their zone, and naive ISO strings taken as-is
+            numeric = pd.to_numeric(df['timestamp'], errors='coerce')
+            as_unix = self._to_naive_local(
+                pd.to_datetime(numeric, unit='s', utc=True, errors='coerce')
+            )
+            strings = df['timestamp'].where(numeric.isna())
+            aware = strings.astype(str).str.contains(self._TZ_SUFFIX)
+            as_aware = self._to_naive_local(pd.to_datetime(
+                strings.where(aware), format='ISO8601', utc=True, errors='coerce'
+            ))
+            as_naive = pd.to_datetime(
+                strings.where(~aware), format='ISO8601', errors='coerce'
+            ).astype(as_unix.dtype)
+            df['timestamp'] = as_unix.combine_first(as_aware).combine_first(as_naive)
 
             return df
 
@@ -83,6 +96,11 @@ class MetricsProcessor:
             logger.error(f"Error processing metrics: {e}")
             return pd.DataFrame(columns=self.required_columns)
 
+    @staticmethod
+    def _to_naive_local(timestamps: pd.Series) -> pd.Series:
+        """Convert tz-aware timestamps to naive local time"""
+        return timestamps.dt.tz_convert(tzlocal()).dt.tz_localize(None).astype('datetime64[ns]')
+
     def get_statistics(self, df: pd.DataFrame) -> Dict:
         """Calculate statistics for metrics"""
         try:
@@ -71,6 +71,13 @@ class MetricsManager:
             registry=self._registry
         )
         
+        self.llm_request_duration = Histogram(
+            'athena_llm_duration_seconds',
+            'LLM request duration',
+            ['model', 'operation'],
+            registry=self._registry
+        )
+        
         # System metrics
         self.memory_usage = Gauge(
             'athena_memory_usage_bytes',
@@ -87,7 +94,8 @@ class MetricsManager:
         logger.info("Metrics initialized successfully")
 
     def track_request(self, endpoint: str, start_time: float, status: str = 'success'):
-        duration = time.time() - start_time
+        """Record a request; start_time must come from time.perf_counter()"""
+        duration = time.perf_counter() - start_time
         self.request_duration.labels(endpoint=endpoint).observe(duration)
         self.request_count.labels(endpoint=endpoint, status=status).inc()
     
@@ -100,13 +108,13 @@ class MetricsManager:
     @contextmanager
     def track_llm_request(self, model: str, operation: str):
         """Context manager for tracking LLM requests"""
-        start_time = time.time()
         self.llm_requests.labels(model=model, operation=operation).inc()
+        histogram = self.llm_request_duration.labels(model=model, operation=operation)
+        start_time = time.perf_counter()
         try:
             yield
         finally:
-            duration = time.time() - start_time
-            self.request_duration.labels(endpoint=f"llm_{operation}").observe(duration)
+            histogram.observe(time.perf_counter() - start_time)
         
     def update_system_metrics(self, memory_usage: int, connections: int):
         self.memory_usage.set(memory_usage)
@@ -126,21 +134,27 @@ class MetricsMiddleware(BaseHTTPMiddleware):
         super().__init__(app)
         self.metrics = metrics_manager
 
+    @staticmethod
+    def _endpoint_label(request: Request) -> str:
+        """Use the route template so path parameters don't explode label cardinality"""
+        route = request.scope.get('route')
+        return getattr(route, 'path', None) or request.url.path
+
     async def dispatch(
         self, request: Request, call_next: RequestResponseEndpoint
     ) -> Response:
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             response = await call_next(request)
             self.metrics.track_request(
-                request.url.path,
+                self._endpoint_label(request),
                 start_time,
                 str(response.status_code)
             )
             return response
         except Exception as e:
             self.metrics.track_request(
-                request.url.path,
+                self._endpoint_label(request),
                 start_time,
                 'error'
             )
@@ -1,98 +1,120 @@
+import heapq
 import psutil
 import time
+from dataclasses import dataclass
 from typing import Dict, List
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+@dataclass(slots=True)
+class Metric:
+    name: str
+    value: float
+    unit: str
+    timestamp: str
+    metadata: Dict
+
+    def to_dict(self) -> Dict:
+        return {
+            'name': self.name,
+            'value': self.value,
+            'unit': self.unit,
+            'timestamp': self.timestamp,
+            'metadata': self.metadata
+        }
+
 class MetricsCollector:
     def __init__(self):
         self._last_cpu_times = psutil.cpu_times()
         self._last_collect_time = time.time()
+        # Core counts and frequency bounds don't change at runtime
+        self._cores = psutil.cpu_count()
+        self._phys_cores = psutil.cpu_count(logical=False)
+        self._freq_static = psutil.cpu_freq(percpu=False)
+        # Process handles are kept across ticks so cpu_percent has a baseline
+        self._proc_cache: Dict[int, psutil.Process] = {}
 
     async def get_performance_metrics(self) -> List[Dict]:
         try:
-            metrics = []
+            metrics: List[Metric] = []
             
             # CPU Metrics
-            cpu_metrics = self._collect_cpu_metrics()
-            metrics.extend(cpu_metrics)
+            metrics.extend(self._collect_cpu_metrics())
             
             # Memory Metrics
-            memory_metrics = self._collect_memory_metrics()
-            metrics.extend(memory_metrics)
+            metrics.extend(self._collect_memory_metrics())
             
             # Disk Metrics
-            disk_metrics = self._collect_disk_metrics()
-            metrics.extend(disk_metrics)
+            metrics.extend(self._collect_disk_metrics())
             
             # Process Metrics
-            process_metrics = self._collect_process_metrics()
-            metrics.extend(process_metrics)
+            metrics.extend(self._collect_process_metrics())
             
-            return metrics
+            # Serialize once at the boundary
+            return [metric.to_dict() for metric in metrics]
             
         except Exception as e:
             logger.error(f"Error collecting metrics: {e}")
             return []
 
-    def _collect_cpu_metrics(self) -> List[Dict]:
+    def _collect_cpu_metrics(self) -> List[Metric]:
         metrics = []
         timestamp = datetime.now().isoformat()
 
         # Overall CPU usage
         cpu_percent = psutil.cpu_percent(interval=1)
-        metrics.append({
-            'name': 'cpu_usage',
-            'value': cpu_percent,
-            'unit': '%',
-            'timestamp': timestamp,
-            'metadata': {
-                'cores': psutil.cpu_count(),
-                'physical_cores': psutil.cpu_count(logical=False)
+        metrics.append(Metric(
+            name='cpu_usage',
+            value=cpu_percent,
+            unit='%',
+            timestamp=timestamp,
+            metadata={
+                'cores': self._cores,
+                'physical_cores': self._phys_cores
             }
-        })
+        ))
 
         # Per-core CPU usage
         per_cpu = psutil.cpu_percent(interval=1, percpu=True)
         for i, usage in enumerate(per_cpu):
-            metrics.append({
-                'name': f'cpu_core_{i}_usage',
-                'value': usage,
-                'unit': '%',
-                'timestamp': timestamp,
-                'metadata': {
+            metrics.append(Metric(
+                name=f'cpu_core_{i}_usage',
+                value=usage,
+                unit='%',
+                timestamp=timestamp,
+                metadata={
                     'core_id': i
                 }
-            })
+            ))
 
         # CPU frequency
-        freq = psutil.cpu_freq(percpu=False)
-        if freq:
-            metrics.append({
-                'name': 'cpu_frequency',
-                'value': freq.current,
-                'unit': 'MHz',
-                'timestamp': timestamp,
-                'metadata': {
-                    'min': freq.min,
-                    'max': freq.max
+        if self._freq_static:
+            freq = psutil.cpu_freq(percpu=False)
+            metrics.append(Metric(
+                name='cpu_frequency',
+                value=freq.current if freq else self._freq_static.current,
+                unit='MHz',
+                timestamp=timestamp,
+                metadata={
+                    'min': self._freq_static.min,
+                    'max': self._freq_static.max
                 }
-            })
+            ))
 
         return metrics
 
-    def _collect_memory_metrics(self) -> List[Dict]:
+    def _collect_memory_metrics(self) -> List[Metric]:
         timestamp = datetime.now().isoformat()
         memory = psutil.virtual_memory()
         
-        return [{
-            'name': 'memory_usage',
-            'value': memory.percent,
-            'unit': '%',
-            'timestamp': timestamp,
-            'metadata': {
+        return [Metric(
+            name='memory_usage',
+            value=memory.percent,
+            unit='%',
+            timestamp=timestamp,
+            metadata={
                 'total_bytes': memory.total,
                 'available_bytes': memory.available,
                 'used_bytes': memory.used,
@@ -100,63 +122,87 @@ class MetricsCollector:
                 'cached_bytes': getattr(memory, 'cached', 0),
                 'shared_bytes': getattr(memory, 'shared', 0)
             }
-        }]
+        )]
 
-    def _collect_disk_metrics(self) -> List[Dict]:
+    def _collect_disk_metrics(self) -> List[Metric]:
         metrics = []
         timestamp = datetime.now().isoformat()
 
         for partition in psutil.disk_partitions(all=False):
             try:
                 usage = psutil.disk_usage(partition.mountpoint)
-                metrics.append({
-                    'name': 'disk_usage',
-                    'value': usage.percent,
-                    'unit': '%',
-                    'timestamp': timestamp,
-                    'metadata': {
+                metrics.append(Metric(
+                    name='disk_usage',
+                    value=usage.percent,
+                    unit='%',
+                    timestamp=timestamp,
+                    metadata={
                         'mountpoint': partition.mountpoint,
                         'filesystem': partition.fstype,
                         'total_bytes': usage.total,
                         'used_bytes': usage.used,
                         'free_bytes': usage.free
                     }
-                })
+                ))
             except Exception:
                 continue
 
         return metrics
 
-    def _collect_process_metrics(self, top_n: int = 5) -> List[Dict]:
+    def _collect_process_metrics(self, top_n: int = 5) -> List[Metric]:
         metrics = []
         timestamp = datetime.now().isoformat()
 
+        current_pids = set()
+        primed_pids = set()
+        for proc in psutil.process_iter(['name']):
+            current_pids.add(proc.pid)
+            # process_iter hands back the same object while a process lives,
+            # a new one means the pid was reused and the cached handle is stale
+            if proc is not self._proc_cache.get(proc.pid):
+                try:
+                    # First call only primes the counter and always returns 0.0
+                    proc.cpu_percent(None)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    self._proc_cache.pop(proc.pid, None)
+                    continue
+                self._proc_cache[proc.pid] = proc
+                primed_pids.add(proc.pid)
+
+        for pid in list(self._proc_cache):
+            if pid not in current_pids:
+                del self._proc_cache[pid]
+
         processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
+        for pid, proc in self._proc_cache.items():
+            # A counter primed a few milliseconds ago only measures /proc tick
+            # quantization; report it from the next collection on
+            if pid in primed_pids:
+                continue
             try:
-                pinfo = proc.as_dict(attrs=['pid', 'name', 'cpu_percent', 'memory_percent'])
-                processes.append(pinfo)
+                processes.append((
+                    proc.cpu_percent(None) or 0,
+                    proc.memory_percent() or 0,
+                    pid,
+                    proc.info['name']
+                ))
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
 
-        # Sort by CPU usage
-        top_cpu_processes = sorted(processes, 
-                                 key=lambda x: x['cpu_percent'] or 0, 
-                                 reverse=True)[:top_n]
-
-        for proc in top_cpu_processes:
-            metrics.append({
-                'name': f'process_{proc["name"]}',
-                'value': proc['cpu_percent'] or 0,
-                'unit': '%',
-                'timestamp': timestamp,
-                'metadata': {
-                    'pid': proc['pid'],
-                    'process_name': proc['name'],
-                    'cpu_percent': proc['cpu_percent'] or 0,
-                    'memory_percent': proc['memory_percent'] or 0
+        # Top N by CPU usage
+        for cpu_percent, memory_percent, pid, name in heapq.nlargest(top_n, processes):
+            metrics.append(Metric(
+                name=f'process_{name}',
+                value=cpu_percent,
+                unit='%',
+                timestamp=timestamp,
+                metadata={
+                    'pid': pid,
+                    'process_name': name,
+                    'cpu_percent': cpu_percent,
+                    'memory_percent': memory_percent
                 }
-            })
+            ))
 
         return metrics
 
@@ -1,6 +1,7 @@
 from typing import Dict, List
 import pandas as pd
 import numpy as np
+import bottleneck as bn
 from datetime import datetime, timedelta
 import logging
 from .metric_model import MetricModel
@@ -16,10 +17,8 @@ class MetricPredictor:
         """Generate predictions for each metric"""
         predictions = {}
         
-        for metric in data['metric'].unique():
+        for metric, metric_data in data.groupby('metric', sort=False):
             try:
-                metric_data = data[data['metric'] == metric].copy()
-                
                 # Load or train model
                 try:
                     prophet_model = self.model.load_model(metric)
@@ -61,50 +60,46 @@ class MetricPredictor:
         
         for metric in data['metric'].unique():
             try:
-                metric_data = data[data['metric'] == metric].copy()
+                metric_data = data[data['metric'] == metric]
                 
                 if len(metric_data) < 2:
                     continue
                     
                 # Calculate rolling statistics
-                rolling_mean = metric_data['value'].rolling(
-                    window=5,
-                    min_periods=1
-                ).mean()
+                values = metric_data['value'].to_numpy(np.float64)
+                rolling_mean = bn.move_mean(values, 5, min_count=1)
+                rolling_std = bn.move_std(values, 5, min_count=1, ddof=1)
                 
-                rolling_std = metric_data['value'].rolling(
-                    window=5,
-                    min_periods=1
-                ).std()
-                
-                # Z-score based detection
-                z_scores = np.abs(
-                    (metric_data['value'] - rolling_mean) / rolling_std
-                )
+                # Z-score based detection; a flat window has no spread, and the
+                # running mean's rounding error must not turn it into an anomaly
+                z_scores = np.abs(np.divide(
+                    values - rolling_mean, rolling_std,
+                    out=np.zeros_like(values), where=rolling_std > 1e-12
+                ))
                 
                 # Find anomalies
-                anomaly_points = metric_data[
-                    z_scores > self.anomaly_threshold
-                ].copy()
+                idx = np.flatnonzero(z_scores > self.anomaly_threshold)
+                timestamps = metric_data['timestamp'].iloc[idx]
+                zs = z_scores[idx]
                 
-                for _, point in anomaly_points.iterrows():
-                    # Determine severity based on z-score
-                    z_score = z_scores[point.name]
-                    if z_score > 5:
-                        severity = 'critical'
-                    elif z_score > 4:
-                        severity = 'high'
-                    else:
-                        severity = 'medium'
-                    
-                    anomalies.append({
+                # Determine severity based on z-score
+                severities = np.where(
+                    zs > 5, 'critical', np.where(zs > 4, 'high', 'medium')
+                )
+                
+                anomalies.extend(
+                    {
                         'metric': metric,
-                        'timestamp': point['timestamp'].isoformat(),
-                        'value': point['value'],
-                        'expected_value': rolling_mean[point.name],
+                        'timestamp': ts.isoformat(),
+                        'value': value,
+                        'expected_value': expected,
                         'deviation': z_score,
-                        'severity': severity
-                    })
+                        'severity': str(severity)
+                    }
+                    for ts, value, expected, z_score, severity in zip(
+                        timestamps, values[idx], rolling_mean[idx], zs, severities
+                    )
+                )
                     
             except Exception as e:
                 logger.error(f"Error detecting anomalies for {metric}: {e}")
@@ -121,33 +116,40 @@ class MetricPredictor:
         change_points = []
         
         for metric in data['metric'].unique():
-            metric_data = data[data['metric'] == metric].copy()
+            metric_data = data[data['metric'] == metric]
             
             if len(metric_data) < window * 2:
                 continue
                 
             try:
-                # Calculate rolling statistics
-                rolling_mean = metric_data['value'].rolling(
-                    window=window,
-                    min_periods=1
-                ).mean()
-                
-                # Calculate percent change
-                pct_change = rolling_mean.pct_change()
-                
-                # Find significant changes
-                significant_changes = metric_data[
-                    abs(pct_change) > 0.1  # 10% change threshold
-                ].copy()
-                
-                for _, point in significant_changes.iterrows():
-                    change_points.append({
+                # Rolling mean and percent change in a single numpy pass
+                values = metric_data['value'].to_numpy(np.float64)
+                rolling_mean = bn.move_mean(values, window, min_count=1)
+                # The running sum leaves a ~1e-14 residue after a run of zeros;
+                # snap it back to 0 so a rise from zero reads as +inf, not as a
+                # huge change of arbitrary sign
+                rolling_mean[np.abs(rolling_mean) <= 1e-12] = 0.0
+                
+                pct_change = np.empty_like(rolling_mean)
+                pct_change[0] = np.nan
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    pct_change[1:] = (
+                        (rolling_mean[1:] - rolling_mean[:-1]) / rolling_mean[:-1]
+                    )
+                
+                # Find significant changes (10% change threshold)
+                idx = np.flatnonzero(np.abs(pct_change) > 0.1)
+                timestamps = metric_data['timestamp'].iloc[idx]
+                
+                change_points.extend(
+                    {
                         'metric': metric,
-                        'timestamp': point['timestamp'].isoformat(),
-                        'value': point['value'],
-                        'change_percentage': pct_change[point.name] * 100
-                    })
+                        'timestamp': ts.isoformat(),
+                        'value': values[i],
+                        'change_percentage': pct_change[i] * 100
+                    }
+                    for ts, i in zip(timestamps, idx)
+                )
                     
             except Exception as e:
                 logger.error(
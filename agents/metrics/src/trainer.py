@@ -1,5 +1,9 @@
+import asyncio
+import os
 import pandas as pd
 import numpy as np
+import bottleneck as bn
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 import logging
 from datetime import datetime, timedelta
@@ -24,65 +28,79 @@ class MetricModelTrainer:
         # Process features
         processed_data = self.feature_processor.process_context(training_data)
         
+        # Partition once instead of re-scanning the frame per metric
+        metric_groups = dict(tuple(processed_data.groupby('metric', sort=False)))
+        
         # Get metrics to train
         if not metrics:
-            metrics = processed_data['metric'].unique()
+            metrics = list(metric_groups)
             
-        # Train model for each metric
-        for metric in metrics:
-            try:
-                logger.info(f"Training model for metric: {metric}")
-                
-                metric_data = processed_data[
-                    processed_data['metric'] == metric
-                ].copy()
-                
-                if len(metric_data) < 24:  # Minimum data requirement
-                    logger.warning(
-                        f"Insufficient data for {metric}. "
-                        f"Need at least 24 points, got {len(metric_data)}"
-                    )
-                    continue
-                
-                # Determine seasonality based on data patterns
-                seasonality_mode = self._detect_seasonality_mode(metric_data)
-                
-                # Train model
-                model, metrics = self.model.train(
-                    metric_data,
-                    metric,
-                    seasonality_mode=seasonality_mode
+        # Train metrics concurrently; Prophet's Stan fit runs outside the GIL
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            tasks = {
+                metric: loop.run_in_executor(
+                    executor,
+                    self._train_metric,
+                    metric_groups.get(metric, processed_data.iloc[0:0]),
+                    metric
                 )
-                
-                results[metric] = {
-                    'status': 'success',
-                    'samples': len(metric_data),
-                    'metrics': metrics,
-                    'seasonality': seasonality_mode
-                }
-                
-            except Exception as e:
-                logger.error(f"Error training model for {metric}: {e}")
-                results[metric] = {
-                    'status': 'error',
-                    'error': str(e)
-                }
+                for metric in metrics
+            }
+            for metric, task in tasks.items():
+                result = await task
+                if result is not None:
+                    results[metric] = result
                 
         return results
     
+    def _train_metric(
+        self,
+        metric_data: pd.DataFrame,
+        metric: str
+    ) -> Optional[Dict]:
+        """Train a single metric model, returning None if data is insufficient"""
+        try:
+            logger.info(f"Training model for metric: {metric}")
+            
+            if len(metric_data) < 24:  # Minimum data requirement
+                logger.warning(
+                    f"Insufficient data for {metric}. "
+                    f"Need at least 24 points, got {len(metric_data)}"
+                )
+                return None
+            
+            # Determine seasonality based on data patterns
+            seasonality_mode = self._detect_seasonality_mode(metric_data)
+            
+            # Train model
+            model, model_metrics = self.model.train(
+                metric_data,
+                metric,
+                seasonality_mode=seasonality_mode
+            )
+            
+            return {
+                'status': 'success',
+                'samples': len(metric_data),
+                'metrics': model_metrics,
+                'seasonality': seasonality_mode
+            }
+            
+        except Exception as e:
+            logger.error(f"Error training model for {metric}: {e}")
+            return {
+                'status': 'error',
+                'error': str(e)
+            }
+    
     def _detect_seasonality_mode(self, data: pd.DataFrame) -> str:
         """Detect whether to use additive or multiplicative seasonality"""
         try:
             # Calculate rolling statistics
-            rolling_mean = data['value'].rolling(
-                window=24,
-                min_periods=1
-            ).mean()
-            
-            rolling_std = data['value'].rolling(
-                window=24,
-                min_periods=1
-            ).std()
+            values = data['value'].to_numpy(np.float64)
+            rolling_mean = bn.move_mean(values, 24, min_count=1)
+            rolling_std = bn.move_std(values, 24, min_count=1, ddof=1)
             
             # Calculate correlation between mean and std
             correlation = np.corrcoef(
@@ -108,36 +126,19 @@ class MetricModelTrainer:
             # Generate predictions
             predictions = model.predict(validation_data)
             
-            # Calculate metrics
-            mae = np.mean(
-                np.abs(
-                    validation_data['value'] - 
-                    predictions['predictions']['yhat']
-                )
-            )
+            # Compute residuals once and reuse them for every metric
+            y = validation_data['value'].to_numpy(np.float64)
+            yhat = predictions['predictions']['yhat'].to_numpy(np.float64)
+            err = y - yhat
+            sq_err = err * err
             
-            rmse = np.sqrt(
-                np.mean(
-                    np.square(
-                        validation_data['value'] - 
-                        predictions['predictions']['yhat']
-                    )
-                )
-            )
+            mae = np.abs(err).mean()
+            rmse = np.sqrt(sq_err.mean())
             
             # Calculate R-squared
-            ss_res = np.sum(
-                np.square(
-                    validation_data['value'] - 
-                    predictions['predictions']['yhat']
-                )
-            )
-            ss_tot = np.sum(
-                np.square(
-                    validation_data['value'] - 
-                    validation_data['value'].mean()
-                )
-            )
+            ss_res = sq_err.sum()
+            dev = y - y.mean()
+            ss_tot = dev @ dev
             r2 = 1 - (ss_res / ss_tot)
             
             return {
@@ -8,6 +8,23 @@ from .prometheus_loader import PrometheusDataLoader
 
 logger = logging.getLogger(__name__)
 
+INSERT_CHUNK_SIZE = 1000
+
+def _psql_insert_values(table, conn, keys, data_iter):
+    """pandas to_sql method sending each chunk as one multi-row INSERT via execute_values"""
+    # Only the PostgreSQL path needs psycopg2, other dialects use 'multi'
+    from psycopg2.extras import execute_values
+
+    columns = ', '.join(f'"{key}"' for key in keys)
+    table_name = f'{table.schema}.{table.name}' if table.schema else table.name
+    with conn.connection.cursor() as cursor:
+        execute_values(
+            cursor,
+            f'INSERT INTO {table_name} ({columns}) VALUES %s',
+            data_iter,
+            page_size=INSERT_CHUNK_SIZE
+        )
+
 class MetricDataLoader:
     def __init__(self):
         self.required_columns = ['timestamp', 'value', 'metric']
@@ -102,12 +119,19 @@ class MetricDataLoader:
                 # Convert to DataFrame
                 df = pd.DataFrame(metrics)
                 
-                # Write to database
+                # Write to database in batched round-trips
+                if session.bind.dialect.name == 'postgresql':
+                    method = _psql_insert_values
+                else:
+                    method = 'multi'
+
                 df.to_sql(
                     'metrics',
                     session.bind,
                     if_exists='append',
-                    index=False
+                    index=False,
+                    method=method,
+                    chunksize=INSERT_CHUNK_SIZE
                 )
                 
                 session.commit()
@@ -1,5 +1,7 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from functools import partial
+import asyncio
 import os
 import json
 import joblib
@@ -14,12 +16,14 @@ class MetricModelRegistry:
         self.model_dir = settings.METRIC_CONFIG['model_dir']
         self._ensure_model_dir()
         self.models: Dict[str, MetricProphetModel] = {}
+        # File mtime each cached model was loaded from, to detect retrains
+        self._loaded_mtime: Dict[str, float] = {}
+        # Parsed metadata keyed by metric, with the file mtime it was read at
+        self._meta_cache: Dict[str, Tuple[float, Dict]] = {}
 
     def _ensure_model_dir(self):
         """Create model directory if it doesn't exist"""
-        if not os.path.exists(self.model_dir):
-            os.makedirs(self.model_dir)
-            logger.info(f"Created model directory: {self.model_dir}")
+        os.makedirs(self.model_dir, exist_ok=True)
 
     def _get_model_path(self, metric_type: str) -> str:
         """Get path for model file"""
@@ -37,9 +41,14 @@ class MetricModelRegistry:
     ) -> bool:
         """Save model and metadata to disk"""
         try:
+            loop = asyncio.get_running_loop()
+
             # Save model
             model_path = self._get_model_path(metric_type)
-            joblib.dump(model, model_path)
+            await loop.run_in_executor(
+                None,
+                partial(joblib.dump, model, model_path, compress=3)
+            )
 
             # Update metadata
             metadata.update({
@@ -49,11 +58,17 @@ class MetricModelRegistry:
 
             # Save metadata
             metadata_path = self._get_metadata_path(metric_type)
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            await loop.run_in_executor(
+                None,
+                self._write_metadata,
+                metadata_path,
+                metadata
+            )
+            self._meta_cache.pop(metric_type, None)
 
             # Update in-memory cache
             self.models[metric_type] = model
+            self._loaded_mtime[metric_type] = os.stat(model_path).st_mtime
 
             logger.info(f"Saved model for {metric_type}")
             return True
@@ -65,20 +80,27 @@ class MetricModelRegistry:
     async def load_model(self, metric_type: str) -> Optional[MetricProphetModel]:
         """Load model from disk or memory"""
         try:
-            # Check in-memory cache
-            if metric_type in self.models:
-                return self.models[metric_type]
-
-            # Load from disk
             model_path = self._get_model_path(metric_type)
-            if not os.path.exists(model_path):
+            try:
+                mtime = os.stat(model_path).st_mtime
+            except FileNotFoundError:
                 logger.warning(f"No model found for {metric_type}")
                 return None
 
-            model = joblib.load(model_path)
+            # Check in-memory cache, unless the file was rewritten since
+            if (
+                metric_type in self.models
+                and self._loaded_mtime.get(metric_type) == mtime
+            ):
+                return self.models[metric_type]
+
+            # Load from disk
+            loop = asyncio.get_running_loop()
+            model = await loop.run_in_executor(None, joblib.load, model_path)
             
             # Update cache
             self.models[metric_type] = model
+            self._loaded_mtime[metric_type] = mtime
             
             return model
 
@@ -86,25 +108,74 @@ class MetricModelRegistry:
             logger.error(f"Error loading model {metric_type}: {e}")
             return None
 
+    @staticmethod
+    def _write_metadata(metadata_path: str, metadata: Dict):
+        """Blocking metadata write, run in an executor"""
+        with open(metadata_path, 'w') as f:
+            json.dump(metadata, f, indent=2)
+
     async def get_model_info(self, metric_type: str) -> Optional[Dict]:
         """Get model metadata"""
         try:
             metadata_path = self._get_metadata_path(metric_type)
-            if not os.path.exists(metadata_path):
+            try:
+                mtime = os.stat(metadata_path).st_mtime
+            except FileNotFoundError:
+                self._meta_cache.pop(metric_type, None)
                 return None
 
-            with open(metadata_path, 'r') as f:
-                return json.load(f)
+            return self._read_metadata(metric_type, metadata_path, mtime)
 
         except Exception as e:
             logger.error(f"Error loading model info for {metric_type}: {e}")
             return None
 
+    async def get_model_info_batch(self, metric_types: List[str]) -> Dict[str, Dict]:
+        """Get metadata for several models with a single directory scan"""
+        wanted = {
+            f"{metric_type}_metadata.json": metric_type
+            for metric_type in metric_types
+        }
+        infos = {}
+        try:
+            with os.scandir(self.model_dir) as entries:
+                for entry in entries:
+                    metric_type = wanted.get(entry.name)
+                    if metric_type is None or not entry.is_file():
+                        continue
+                    try:
+                        infos[metric_type] = self._read_metadata(
+                            metric_type,
+                            entry.path,
+                            entry.stat().st_mtime
+                        )
+                    except (OSError, ValueError) as e:
+                        logger.error(f"Error loading model info for {metric_type}: {e}")
+
+        except Exception as e:
+            logger.error(f"Error loading model info batch: {e}")
+
+        return infos
+
+    def _read_metadata(self, metric_type: str, path: str, mtime: float) -> Dict:
+        """Parse a metadata file, reusing the cached copy if mtime is unchanged"""
+        cached_mtime, cached_info = self._meta_cache.get(metric_type, (None, None))
+        if cached_mtime != mtime:
+            # Read with the stdlib parser that wrote it, which accepts the
+            # NaN/Infinity tokens a flat validation series produces
+            with open(path, 'rb') as f:
+                cached_info = json.loads(f.read())
+            self._meta_cache[metric_type] = (mtime, cached_info)
+
+        return dict(cached_info)
+
     async def delete_model(self, metric_type: str) -> bool:
         """Delete model and metadata"""
         try:
             # Remove from cache
             self.models.pop(metric_type, None)
+            self._loaded_mtime.pop(metric_type, None)
+            self._meta_cache.pop(metric_type, None)
 
             # Delete files
             model_path = self._get_model_path(metric_type)
@@ -125,11 +196,16 @@ class MetricModelRegistry:
         """List all available models and their metadata"""
         models = {}
         try:
-            for file in os.listdir(self.model_dir):
-                if file.endswith('_metadata.json'):
-                    metric_type = file.replace('_metadata.json', '')
-                    if info := await self.get_model_info(metric_type):
-                        models[metric_type] = info
+            suffix = '_metadata.json'
+            with os.scandir(self.model_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(suffix) and entry.is_file():
+                        metric_type = entry.name[:-len(suffix)]
+                        try:
+                            with open(entry.path, 'rb') as f:
+                                models[metric_type] = json.loads(f.read())
+                        except (OSError, ValueError) as e:
+                            logger.error(f"Error loading model info for {metric_type}: {e}")
 
             return models
 
@@ -1,16 +1,15 @@
 import asyncio
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
 from sqlalchemy.orm import Session
-from sqlalchemy import create_engine, func, and_
+from sqlalchemy import create_engine, func, and_, or_
 from src.models.metric_model import MetricProphetModel
 from src.models.db_models import metrics as Metric
 from .data_loader import MetricDataLoader
 from src.config.settings import settings
 from .model_registry import MetricModelRegistry
 from dotenv import load_dotenv
-import os 
 logger = logging.getLogger(__name__)
 
 class MetricModelTrainer:
@@ -20,7 +19,13 @@ class MetricModelTrainer:
             if not db_url:
                 raise ValueError("Database URL not configured")
                 
-            self.engine = create_engine(db_url)
+            self.engine = create_engine(
+                db_url,
+                pool_size=5,
+                max_overflow=10,
+                pool_pre_ping=True,
+                pool_recycle=1800
+            )
             logger.info("MetricModelTrainer initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize database connection: {e}")
@@ -34,7 +39,6 @@ class MetricModelTrainer:
             'memory_usage',
             'disk_usage'
         ]
-        self.engine = create_engine(os.getenv('DATABASE_URL'))
 
     def get_session(self):
         return Session(self.engine)
@@ -48,13 +52,35 @@ class MetricModelTrainer:
         """Train all metric models"""
         results = {}
         
+        # Read all model metadata up front; metrics without a model map to {}
+        model_infos = {}
+        new_data_counts = None
+        if not force:
+            model_infos = await self.model_registry.get_model_info_batch(
+                self.metrics_to_train
+            )
+            try:
+                new_data_counts = await self._get_new_data_counts([
+                    (metric_type, datetime.fromisoformat(info['last_trained']))
+                    for metric_type, info in model_infos.items()
+                    if info.get('last_trained')
+                ])
+            except Exception as e:
+                # Fall back to per-metric counts in _should_train
+                logger.error(f"Error counting new data points: {e}")
+        
         for metric_type in self.metrics_to_train:
             try:
                 result = await self.train_model(
                     metric_type,
                     force=force,
                     start_date=start_date,
-                    end_date=end_date
+                    end_date=end_date,
+                    cached_info=model_infos.get(metric_type, {}),
+                    new_data_count=(
+                        new_data_counts.get(metric_type, 0)
+                        if new_data_counts is not None else None
+                    )
                 )
                 results[metric_type] = result
             except Exception as e:
@@ -71,13 +97,19 @@ class MetricModelTrainer:
         metric_type: str,
         force: bool = False,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        cached_info: Optional[Dict] = None,
+        new_data_count: Optional[int] = None
     ) -> Dict:
         """Train model for specific metric type"""
         async with self.training_lock:
             try:
                 # Check if we need to train
-                if not force and not await self._should_train(metric_type):
+                if not force and not await self._should_train(
+                    metric_type,
+                    cached_info,
+                    new_data_count
+                ):
                     logger.info(f"Skipping training for {metric_type} - model is up to date")
                     return {
                         'status': 'skipped',
@@ -137,10 +169,16 @@ class MetricModelTrainer:
                     'error': str(e)
                 }
 
-    async def _should_train(self, metric_type: str) -> bool:
+    async def _should_train(
+        self,
+        metric_type: str,
+        model_info: Optional[Dict] = None,
+        new_data_count: Optional[int] = None
+    ) -> bool:
         """Determine if model needs training"""
         try:
-            model_info = await self.model_registry.get_model_info(metric_type)
+            if model_info is None:
+                model_info = await self.model_registry.get_model_info(metric_type)
             
             # If no model exists
             if not model_info:
@@ -150,7 +188,8 @@ class MetricModelTrainer:
             training_frequency = timedelta(hours=model_info.get('training_frequency_hours', 24))
             
             # Check data volume since last training
-            new_data_count = await self._get_new_data_count(metric_type, last_trained)
+            if new_data_count is None:
+                new_data_count = await self._get_new_data_count(metric_type, last_trained)
             min_new_samples = model_info.get('min_new_samples', 100)
             
             return (
@@ -162,14 +201,54 @@ class MetricModelTrainer:
 
     async def _get_new_data_count(self, metric_type: str, since: datetime) -> int:
         """Count new data points since last training"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            self._query_new_data_count,
+            metric_type,
+            since
+        )
+
+    def _query_new_data_count(self, metric_type: str, since: datetime) -> int:
         with self.get_session() as session:
             count = session.query(func.count()).filter(
                 and_(
-                    Metric.metric_name == metric_type,
-                    Metric.timestamp > since
+                    Metric.c.metric_name == metric_type,
+                    Metric.c.timestamp > since
                 )
             ).scalar()
             return count or 0
+
+    async def _get_new_data_counts(
+        self,
+        pairs: List[Tuple[str, datetime]]
+    ) -> Dict[str, int]:
+        """Count new data points for several metrics in one grouped query"""
+        if not pairs:
+            return {}
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._query_new_data_counts, pairs)
+
+    def _query_new_data_counts(
+        self,
+        pairs: List[Tuple[str, datetime]]
+    ) -> Dict[str, int]:
+        with self.get_session() as session:
+            rows = session.query(
+                Metric.c.metric_name,
+                func.count()
+            ).filter(
+                or_(*[
+                    and_(
+                        Metric.c.metric_name == metric_type,
+                        Metric.c.timestamp > since
+                    )
+                    for metric_type, since in pairs
+                ])
+            ).group_by(Metric.c.metric_name).all()
+            return {metric_type: count for metric_type, count in rows}
+
     async def start_periodic_training(self, interval_hours: int = 24):
         """Start periodic training of all models"""
         while True:
@@ -1,7 +1,10 @@
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import httpx
+import numpy as np
+import orjson
 import pandas as pd
+from dateutil.tz import tzlocal
 import logging
 
 logger = logging.getLogger(__name__)
@@ -43,19 +46,33 @@ class PrometheusDataLoader:
                     }
                 )
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
 
                 if "data" in data and "result" in data["data"]:
-                    values = []
+                    # Build timestamp/value columns per series, not a dict per point
+                    ts_cols = []
+                    value_cols = []
                     for result in data["data"]["result"]:
-                        for value in result["values"]:
-                            values.append({
-                                'timestamp': datetime.fromtimestamp(value[0]),
-                                'value': float(value[1]),
-                                'metric': metric_type
-                            })
-                    
-                    return pd.DataFrame(values)
+                        if not result["values"]:
+                            continue
+                        points = np.asarray(result["values"], dtype=object)
+                        ts_cols.append(points[:, 0].astype(np.float64))
+                        value_cols.append(points[:, 1].astype(np.float64))
+
+                    if not ts_cols:
+                        return pd.DataFrame()
+
+                    # Unix seconds to local time, as datetime.fromtimestamp did
+                    timestamps = (
+                        pd.to_datetime(np.concatenate(ts_cols), unit='s', utc=True)
+                        .tz_convert(tzlocal())
+                        .tz_localize(None)
+                    )
+                    return pd.DataFrame({
+                        'timestamp': timestamps,
+                        'value': np.concatenate(value_cols),
+                        'metric': metric_type
+                    })
                 return pd.DataFrame()
 
         except Exception as e:
@@ -1,14 +1,20 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
-from scipy import stats
+from scipy import special
 from datetime import datetime, timedelta
 import logging
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Directions partagées par tous les résultats
+_INC = 'increasing'
+_DEC = 'decreasing'
+_STA = 'stable'
+_ERR = 'error'
+
+@dataclass(slots=True)
 class TrendResult:
     direction: str  # 'increasing', 'decreasing', or 'stable'
     slope: float
@@ -35,17 +41,15 @@ class TrendAnalyzer:
                 return self._get_insufficient_data_result()
 
             # Calcul de la tendance linéaire
-            x = np.arange(len(data))
-            y = data['value'].values
-            
-            slope, intercept, r_value, p_value, std_err = stats.linregress(x, y)
+            y = data['value'].to_numpy(dtype=np.float64)
+            slope, intercept, r_value, p_value = self._linear_trend(y)
             
             # Déterminer la direction et la confiance
             direction = self._determine_direction(slope, p_value)
             confidence = abs(r_value)
             
             # Calculer le changement en pourcentage
-            change_percent = self._calculate_change_percent(data['value'])
+            change_percent = self._calculate_change_percent(y)
             
             # Détecter la saisonnalité si suffisamment de données
             seasonality = None
@@ -55,7 +59,18 @@ class TrendAnalyzer:
             # Générer une prévision simple si possible
             forecast = None
             if len(data) >= window_size:
-                forecast = self._generate_forecast(data, slope, intercept, window_size)
+                hourly_mean = None
+                if seasonality == 'daily':
+                    # Écart saisonnier seulement : la droite de tendance porte déjà le niveau
+                    hourly_mean = data.groupby(data.index.hour)['value'].mean() - y.mean()
+                forecast = self._generate_forecast(
+                    data,
+                    slope,
+                    intercept,
+                    window_size,
+                    seasonality=seasonality,
+                    hourly_mean=hourly_mean
+                )
             
             return TrendResult(
                 direction=direction,
@@ -70,19 +85,50 @@ class TrendAnalyzer:
             logger.error(f"Error analyzing trends for {metric_name}: {e}")
             return self._get_error_result()
 
+    def _linear_trend(self, y: np.ndarray) -> Tuple[float, float, float, float]:
+        """Régression linéaire en forme fermée (pente, ordonnée, r, p-value)"""
+        n = y.size
+        y_mean = y.mean()
+        dy = y - y_mean
+        
+        # x = 0..n-1 : moyenne et variance connues analytiquement, et comme
+        # sum(dy) == 0 la covariance se réduit à x @ dy
+        x_mean = (n - 1) / 2.0
+        var_x = n * (n * n - 1) / 12.0
+        var_y = dy @ dy
+        cov = np.arange(n, dtype=np.float64) @ dy
+        
+        slope = cov / var_x
+        intercept = y_mean - slope * x_mean
+        
+        # Série constante : aucune corrélation ni tendance significative
+        if var_y == 0:
+            return float(slope), float(intercept), 0.0, 1.0
+            
+        r = min(max(cov / np.sqrt(var_x * var_y), -1.0), 1.0)
+        if abs(r) == 1.0:
+            return float(slope), float(intercept), float(r), 0.0
+            
+        # Test bilatéral de Student sur r avec n - 2 degrés de liberté
+        df = n - 2
+        t = r * np.sqrt(df / (1.0 - r * r))
+        p_value = 2.0 * special.stdtr(df, -abs(t))
+        
+        return float(slope), float(intercept), float(r), float(p_value)
+
     def _determine_direction(self, slope: float, p_value: float) -> str:
         """Déterminer la direction de la tendance"""
         if p_value > self.significance_level:
-            return 'stable'
-        return 'increasing' if slope > 0 else 'decreasing'
+            return _STA
+        return _INC if slope > 0 else _DEC
 
-    def _calculate_change_percent(self, values: pd.Series) -> float:
+    def _calculate_change_percent(self, values: np.ndarray) -> float:
         """Calculer le pourcentage de changement"""
-        if len(values) < 2:
+        if values.size < 2:
             return 0.0
             
-        first_val = values.iloc[0]
-        last_val = values.iloc[-1]
+        first_val = values[0]
+        last_val = values[-1]
         
         if first_val == 0:
             return float('inf') if last_val > 0 else 0.0
@@ -92,19 +138,21 @@ class TrendAnalyzer:
     def _detect_seasonality(self, data: pd.DataFrame) -> Optional[str]:
         """Détecter les motifs saisonniers"""
         try:
-            # Test pour la saisonnalité quotidienne
-            hourly_groups = data.groupby(data.index.hour)['value'].mean()
-            f_stat, p_val = stats.f_oneway(*[group for name, group in hourly_groups.items()])
+            y = data['value'].to_numpy(dtype=np.float64)
             
-            if p_val < self.significance_level:
+            # Série quasi constante : aucun motif à détecter
+            if y.std() < 1e-9:
+                return None
+                
+            # Test pour la saisonnalité quotidienne
+            hours = data.index.hour.to_numpy()
+            if self._anova_p_value(y, hours, 24) < self.significance_level:
                 return 'daily'
                 
             # Test pour la saisonnalité hebdomadaire
             if len(data) >= 168:  # 7 jours * 24 heures
-                weekly_groups = data.groupby(data.index.dayofweek)['value'].mean()
-                f_stat, p_val = stats.f_oneway(*[group for name, group in weekly_groups.items()])
-                
-                if p_val < self.significance_level:
+                days = data.index.dayofweek.to_numpy()
+                if self._anova_p_value(y, days, 7) < self.significance_level:
                     return 'weekly'
                     
             return None
@@ -113,12 +161,36 @@ class TrendAnalyzer:
             logger.error(f"Error detecting seasonality: {e}")
             return None
 
+    def _anova_p_value(self, y: np.ndarray, groups: np.ndarray, n_groups: int) -> float:
+        """ANOVA à un facteur sur les observations groupées (équivalent à f_oneway)"""
+        # Centrer pour la stabilité numérique des sommes de carrés
+        y = y - y.mean()
+        counts = np.bincount(groups, minlength=n_groups)
+        sums = np.bincount(groups, weights=y, minlength=n_groups)
+        
+        present = counts > 0
+        df_between = int(present.sum()) - 1
+        df_within = y.size - int(present.sum())
+        if df_between < 1 or df_within < 1:
+            return 1.0
+            
+        ss_total = y @ y
+        ss_between = (sums[present] ** 2 / counts[present]).sum()
+        ss_within = ss_total - ss_between
+        if ss_within <= 0:
+            return 0.0
+            
+        f_stat = (ss_between / df_between) / (ss_within / df_within)
+        return float(special.fdtrc(df_between, df_within, f_stat))
+
     def _generate_forecast(
         self,
         data: pd.DataFrame,
         slope: float,
         intercept: float,
-        window_size: int
+        window_size: int,
+        seasonality: Optional[str] = None,
+        hourly_mean: Optional[pd.Series] = None
     ) -> List[float]:
         """Générer une prévision simple basée sur la tendance"""
         try:
@@ -129,12 +201,11 @@ class TrendAnalyzer:
             # Calculer les valeurs prévues
             forecast_values = slope * forecast_x + intercept
             
-            # Ajouter la composante saisonnière si détectée
-            if seasonality := self._detect_seasonality(data):
-                if seasonality == 'daily':
-                    seasonal_pattern = data.groupby(data.index.hour)['value'].mean()
-                    forecast_hours = (data.index[-1].hour + np.arange(1, window_size + 1)) % 24
-                    forecast_values += [seasonal_pattern[hour] for hour in forecast_hours]
+            # Ajouter la composante saisonnière déjà détectée par analyze_trends
+            if seasonality == 'daily' and hourly_mean is not None:
+                seasonal_pattern = hourly_mean.reindex(range(24), fill_value=0.0).to_numpy()
+                forecast_hours = (data.index[-1].hour + np.arange(1, window_size + 1)) % 24
+                forecast_values += seasonal_pattern[forecast_hours]
                     
             return forecast_values.tolist()
             
@@ -145,7 +216,7 @@ class TrendAnalyzer:
     def _get_insufficient_data_result(self) -> TrendResult:
         """Résultat par défaut pour données insuffisantes"""
         return TrendResult(
-            direction='stable',
+            direction=_STA,
             slope=0.0,
             confidence=0.0,
             change_percent=0.0
@@ -154,7 +225,7 @@ class TrendAnalyzer:
     def _get_error_result(self) -> TrendResult:
         """Résultat par défaut en cas d'erreur"""
         return TrendResult(
-            direction='error',
+            direction=_ERR,
             slope=0.0,
             confidence=0.0,
             change_percent=0.0
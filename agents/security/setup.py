@@ -7,6 +7,7 @@ setup(
    install_requires=[
        "athena-core",
        "scipy>=1.10.0",
-       "numpy>=1.24.0"
+       "numpy>=1.24.0",
+       "orjson>=3.9.0"
    ],
 )
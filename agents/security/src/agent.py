@@ -1,4 +1,5 @@
 # src/agents/security/agent.py
+import asyncio
 from datetime import timedelta
 from typing import Dict, List, Optional
 from src.agents.base_agent import BaseAgent
@@ -7,7 +8,7 @@ from .threat_analyzer import ThreatAnalyzer
 from .metrics_generator import SecurityMetricsGenerator
 from .prompt_generator import SecurityPromptGenerator
 import logging
-import json
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -33,30 +34,41 @@ class SecurityAgent(BaseAgent):
             
             # Analyze threats
             threat_stats = self.threat_analyzer.compute_stats(security_issues)
-            risk_level = self.threat_analyzer.calculate_risk_level(security_issues, threat_stats)
+            threat_stats_dict = threat_stats.asdict()
             
-            # Generate metrics
-            metrics = self.metrics_generator.generate_metrics(threat_stats)
-            
-            # Get LLM analysis using prompt
+            # Start the LLM analysis first so the remaining CPU work overlaps it
             prompt = self.prompt_generator.generate_prompt(security_issues)
-            analysis = await self.llm.analyze_with_fallback(
-                json.dumps({
-                    'security_issues': security_issues,
-                    'threat_stats': threat_stats,
-                    'time_window': str(time_window),
-                    'query': query
-                }),
-                base_prompt=prompt
+            payload = orjson.dumps({
+                'security_issues': security_issues,
+                'threat_stats': threat_stats_dict,
+                'time_window': str(time_window),
+                'query': query
+            }, option=orjson.OPT_NON_STR_KEYS).decode()
+            llm_task = asyncio.create_task(
+                self.llm.analyze_with_fallback(payload, base_prompt=prompt)
             )
             
+            try:
+                # Yield once so the task runs up to its first network wait
+                await asyncio.sleep(0)
+                
+                risk_level = self.threat_analyzer.calculate_risk_level(security_issues, threat_stats)
+                
+                # Generate metrics
+                metrics = self.metrics_generator.generate_metrics(threat_stats)
+                
+                analysis = await llm_task
+            except BaseException:
+                llm_task.cancel()
+                raise
+            
             # Extract recommendations
             recommendations = self.prompt_generator.extract_recommendations(analysis)
 
             return {
                 'security_analysis': analysis,
                 'risk_level': risk_level,
-                'threat_stats': threat_stats,
+                'threat_stats': threat_stats_dict,
                 'detected_issues': security_issues,
                 'recommendations': recommendations,
                 'metrics': metrics
@@ -1,27 +1,29 @@
 from datetime import datetime
 from typing import Dict, List
 
+from .threat_analyzer import ThreatStats
+
 # src/agents/security/metrics_generator.py
 class SecurityMetricsGenerator:
-    def generate_metrics(self, stats: Dict) -> List[Dict]:
+    def generate_metrics(self, stats: ThreatStats) -> List[Dict]:
         """Generate security metrics"""
         metrics = []
         timestamp = datetime.now().isoformat()
         
         metrics.append({
             'name': 'security_issues_total',
-            'value': stats['total_issues'],
+            'value': stats.total_issues,
             'timestamp': timestamp
         })
         
-        for severity, count in stats['by_severity'].items():
+        for severity, count in stats.by_severity.items():
             metrics.append({
                 'name': f'security_issues_{severity}',
                 'value': count,
                 'timestamp': timestamp
             })
             
-        for issue_type, count in stats['by_type'].items():
+        for issue_type, count in stats.by_type.items():
             metrics.append({
                 'name': f'security_issues_{issue_type}',
                 'value': count,
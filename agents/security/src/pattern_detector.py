@@ -1,16 +1,17 @@
 from typing import Dict, List, Any
+from collections import Counter
 import re
 from datetime import datetime
 
 class SecurityPatternDetector:
     def __init__(self):
         self.patterns = {
-            'auth_failure': r'(?i)(auth.*fail|login.*fail|invalid.*password|access.*denied)',
-            'injection': r'(?i)(sql|command|code|script).*injection',
+            'auth_failure': r'(auth.*fail|login.*fail|invalid.*password|access.*denied)',
+            'injection': r'(sql|command|code|script).*injection',
             'suspicious_ip': r'\b(?:\d{1,3}\.){3}\d{1,3}\b.*(suspicious|blocked|blacklisted)',
-            'brute_force': r'(?i)(multiple|repeated|brute.*force).*(?:login|attempt|auth)',
-            'privilege_escalation': r'(?i)(sudo|root|admin|privilege).*(?:escalation|elevation)',
-            'malware': r'(?i)(malware|virus|trojan|ransomware|spyware)',
+            'brute_force': r'(multiple|repeated|brute.*force).*(?:login|attempt|auth)',
+            'privilege_escalation': r'(sudo|root|admin|privilege).*(?:escalation|elevation)',
+            'malware': r'(malware|virus|trojan|ransomware|spyware)',
         }
         
         self.severity_map = {
@@ -21,6 +22,18 @@ class SecurityPatternDetector:
             'auth_failure': 'medium',
             'suspicious_ip': 'medium'
         }
+        
+        # Compile once; the union is a single-pass prefilter so clean lines
+        # are rejected without running every pattern
+        self._compiled = {
+            name: re.compile(pattern, re.IGNORECASE)
+            for name, pattern in self.patterns.items()
+        }
+        self._union = re.compile(
+            '|'.join(f'(?P<{name}>{pattern})' for name, pattern in self.patterns.items()),
+            re.IGNORECASE
+        )
+
     def detect_patterns(self, context: List[Dict[str, Any]] | List[str]) -> List[Dict[str, Any]]:
         """Detect security patterns in logs"""
         issues = []
@@ -32,15 +45,18 @@ class SecurityPatternDetector:
                 timestamp = datetime.now().isoformat()
                 metadata = {}
             elif isinstance(item, dict):
-                content = str(item.get('content') if 'content' in item else item.get('message', ''))
+                content = self._get_content(item)
                 timestamp = item.get('timestamp') or item.get('metadata', {}).get('timestamp')
                 metadata = item.get('metadata', {})
             else:
                 continue
                 
+            if not self._union.search(content):
+                continue
+                
             # Process each pattern
-            for pattern_name, pattern in self.patterns.items():
-                if matches := re.finditer(pattern, content, re.IGNORECASE):
+            for pattern_name, pattern in self._compiled.items():
+                if matches := pattern.finditer(content):
                     for match in matches:
                         issues.append({
                             'type': pattern_name,
@@ -53,6 +69,39 @@ class SecurityPatternDetector:
                         
         return issues
 
+    def detect_patterns_counts_only(
+        self,
+        context: List[Dict[str, Any]] | List[str]
+    ) -> Dict[str, Counter]:
+        """Count pattern matches by type and severity without building issue dicts"""
+        by_type = Counter()
+        
+        for item in context:
+            if isinstance(item, str):
+                content = item
+            elif isinstance(item, dict):
+                content = self._get_content(item)
+            else:
+                continue
+                
+            if not self._union.search(content):
+                continue
+                
+            for pattern_name, pattern in self._compiled.items():
+                if count := sum(1 for _ in pattern.finditer(content)):
+                    by_type[pattern_name] += count
+                    
+        by_severity = Counter()
+        for pattern_name, count in by_type.items():
+            by_severity[self.get_severity(pattern_name)] += count
+            
+        return {'by_type': by_type, 'by_severity': by_severity}
+
+    @staticmethod
+    def _get_content(item: Dict[str, Any]) -> str:
+        """Get the log text of a dict context item"""
+        return str(item.get('content') if 'content' in item else item.get('message', ''))
+
     def get_severity(self, issue_type: str) -> str:
         """Get severity level for an issue type"""
         return self.severity_map.get(issue_type, 'low')
\ No newline at end of file
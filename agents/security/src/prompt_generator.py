@@ -1,11 +1,23 @@
-from typing import List, Dict
+from functools import lru_cache
+from typing import FrozenSet, List, Dict
+import re
 
 # src/agents/security/prompt_generator.py
 class SecurityPromptGenerator:
+    _SECTION = re.compile(r'recommend|mitigation', re.IGNORECASE)
+    # A list marker must be followed by whitespace, so markdown emphasis such
+    # as **bold** or *italic* at the start of a line is not taken for a bullet;
+    # a trailing \r from CRLF output is dropped with the other whitespace
+    _BULLET = re.compile(r'^[ \t]*(?:[•\-*]|\d+\.)[ \t]+(.+?)[ \t\r]*$', re.MULTILINE)
+
     def generate_prompt(self, issues: List[Dict]) -> str:
         """Generate security analysis prompt"""
-        issue_types = set(issue['type'] for issue in issues)
-        
+        return self._prompt_for(frozenset(issue['type'] for issue in issues))
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _prompt_for(issue_types: FrozenSet[str]) -> str:
+        """Build the prompt for a set of issue types (at most 2^6 combinations)"""
         sections = ["Analyze the security issues found in the logs with focus on:"]
         
         type_prompts = {
@@ -33,14 +45,16 @@ class SecurityPromptGenerator:
 
     def extract_recommendations(self, analysis: str) -> List[str]:
         """Extract recommendations from analysis"""
-        recommendations = []
-        in_recommendations = False
-        
-        for line in analysis.split('\n'):
-            if 'recommend' in line.lower() or 'mitigation' in line.lower():
-                in_recommendations = True
-            elif in_recommendations and line.strip():
-                if line.startswith(('•', '-', '*', '1.', '2.', '3.')):
-                    recommendations.append(line.strip('•').strip('*').strip('- ').strip())
-                    
-        return recommendations
\ No newline at end of file
+        section = self._SECTION.search(analysis)
+        if not section:
+            return []
+
+        # Bullets on the lines following the first recommendation/mitigation mention
+        line_end = analysis.find('\n', section.end())
+        if line_end == -1:
+            return []
+
+        return [
+            match.group(1)
+            for match in self._BULLET.finditer(analysis, line_end + 1)
+        ]
\ No newline at end of file
@@ -1,51 +1,122 @@
-from typing import Dict, List
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter, methodcaller
+from itertools import islice
+from typing import Dict, Iterable, List
 import re
+import socket
 # src/agents/security/threat_analyzer.py
+
+_OCTET = r'(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)'
+
+def _pack_ipv4(ip: str) -> int:
+    """Dotted quad as a 32-bit int, cheaper to hash and keep than the string"""
+    return int.from_bytes(socket.inet_aton(ip), 'big')
+
+# Indicator-of-compromise patterns, matched together in one alternation so
+# adding a kind does not add another scan over the contexts. Each pattern
+# must only use non-capturing groups, the match is dispatched on lastgroup
+# and stored under the kind's key function
+_IOC_PATTERNS = (
+    ('ipv4', rf'\b(?:{_OCTET}\.){{3}}{_OCTET}\b', _pack_ipv4),
+)
+_IOC_RE = re.compile('|'.join(f'(?P<{kind}>{pattern})' for kind, pattern, _ in _IOC_PATTERNS))
+_IOC_KEYS = {kind: key for kind, _, key in _IOC_PATTERNS}
+SEVERITY_LEVELS = ('critical', 'high', 'medium', 'low')
+STATS_CHUNK_SIZE = 10000
+# Canonical hour keys, shared by every stats dict instead of fresh slices
+_HOURS = tuple(f'{hour:02d}' for hour in range(24))
+
+@dataclass(slots=True)
+class ThreatStats:
+    total_issues: int
+    by_type: Dict[str, int]
+    # Counts in SEVERITY_LEVELS order
+    severity_counts: array
+    unique_ips: List[str]
+    temporal_distribution: Dict[str, int]
+    max_hour_count: int = 0
+
+    @property
+    def by_severity(self) -> Dict[str, int]:
+        return dict(zip(SEVERITY_LEVELS, self.severity_counts))
+
+    def asdict(self) -> Dict:
+        # Public stats mapping; max_hour_count only feeds the risk score
+        return {
+            'total_issues': self.total_issues,
+            'by_type': self.by_type,
+            'by_severity': self.by_severity,
+            'unique_ips': self.unique_ips,
+            'temporal_distribution': self.temporal_distribution
+        }
+
 class ThreatAnalyzer:
-    def compute_stats(self, issues: List[Dict]) -> Dict:
+    def compute_stats(self, issues: Iterable[Dict]) -> ThreatStats:
         """Compute threat statistics"""
-        stats = {
-            'total_issues': len(issues),
-            'by_type': {},
-            'by_severity': {'critical': 0, 'high': 0, 'medium': 0, 'low': 0},
-            'unique_ips': set(),
-            'temporal_distribution': {}
-        }
+        total_issues = 0
+        by_type = Counter()
+        severities = Counter()
+        hour_counts = Counter()
+        iocs = {kind: set() for kind in _IOC_KEYS}
 
-        for issue in issues:
-            # Count by type and severity
-            issue_type = issue['type']
-            severity = issue['severity']
-            stats['by_type'][issue_type] = stats['by_type'].get(issue_type, 0) + 1
-            stats['by_severity'][severity] = stats['by_severity'].get(severity, 0) + 1
+        # Issues are consumed in bounded chunks so a streamed feed never has
+        # to be materialized; each tally is a GROUP BY over one field, and
+        # Counter over itemgetter runs those passes in C
+        issues = iter(issues)
+        while chunk := list(islice(issues, STATS_CHUNK_SIZE)):
+            total_issues += len(chunk)
+            by_type.update(map(itemgetter('type'), chunk))
+            severities.update(map(itemgetter('severity'), chunk))
+            # ISO-8601 puts the hour at a fixed offset after the date separator
+            hour_counts.update(
+                timestamp[11:13]
+                for timestamp in map(methodcaller('get', 'timestamp'), chunk)
+                if timestamp and len(timestamp) >= 13 and timestamp[10] in 'T '
+            )
 
-            # Extract unique IPs
-            if ip_match := re.search(r'\b(?:\d{1,3}\.){3}\d{1,3}\b', issue['context']):
-                stats['unique_ips'].add(ip_match.group(0))
+            # The detector emits one issue per match, all sharing the log line
+            # as context, so each distinct line only needs scanning once. Every
+            # indicator kind so far is dotted; str.count rejects lines with
+            # fewer than three dots far cheaper than the regex would
+            candidates = {
+                context for context in map(itemgetter('context'), chunk)
+                if context.count('.') >= 3
+            }
+            # One regex pass per chunk; the NUL separator keeps matches from
+            # straddling two lines. Only the matches outlive the chunk
+            for match in _IOC_RE.finditer('\x00'.join(candidates)):
+                kind = match.lastgroup
+                iocs[kind].add(_IOC_KEYS[kind](match.group()))
 
-            # Track temporal distribution
-            if timestamp := issue.get('timestamp'):
-                hour = timestamp.split('T')[1][:2]
-                stats['temporal_distribution'][hour] = stats['temporal_distribution'].get(hour, 0) + 1
+        severity_counts = array('q', [severities[level] for level in SEVERITY_LEVELS])
+        temporal_distribution = {hour: hour_counts[hour] for hour in _HOURS if hour in hour_counts}
 
-        stats['unique_ips'] = list(stats['unique_ips'])
-        return stats
+        return ThreatStats(
+            total_issues=total_issues,
+            by_type=dict(by_type),
+            severity_counts=severity_counts,
+            unique_ips=[socket.inet_ntoa(ip.to_bytes(4, 'big')) for ip in sorted(iocs['ipv4'])],
+            temporal_distribution=temporal_distribution,
+            max_hour_count=max(temporal_distribution.values(), default=0)
+        )
 
-    def calculate_risk_level(self, issues: List[Dict], stats: Dict) -> str:
+    def calculate_risk_level(self, issues: List[Dict], stats: ThreatStats) -> str:
         """Calculate overall risk level"""
-        risk_score = 0
-        severity_scores = {'critical': 10, 'high': 5, 'medium': 2, 'low': 1}
+        return self._score(*stats.severity_counts, stats.max_hour_count)
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _score(critical: int, high: int, medium: int, low: int, max_hour_count: int) -> str:
+        """Map severity counts and the busiest-hour count to a risk level"""
         # Calculate score based on issues
-        for severity, count in stats['by_severity'].items():
-            risk_score += severity_scores[severity] * count
+        risk_score = 10 * critical + 5 * high + 2 * medium + low
 
         # Adjust based on temporal concentration
-        temporal_distribution = stats.get('temporal_distribution', {})
-        if len(temporal_distribution) > 0:
-            max_issues_per_hour = max(temporal_distribution.values())
-            if max_issues_per_hour > 10:
-                risk_score *= 1.5
+        if max_hour_count > 10:
+            risk_score *= 1.5
 
         # Determine risk level
         if risk_score > 50:
@@ -54,4 +125,4 @@ class ThreatAnalyzer:
             return 'high'
         elif risk_score > 10:
             return 'medium'
-        return 'low'
\ No newline at end of file
+        return 'low'